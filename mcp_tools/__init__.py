@@ -3,12 +3,15 @@
 from .models import Template, TemplateVariable
 from .loader import (
     load,
+    load_many,
     load_from_url,
+    load_from_urls,
     load_from_path,
     load_from_directory,
     is_url,
+    classify,
 )
-from .parser import parse, render
+from .parser import parse, parse_cached, compile_template, render
 from .generator import register_template
 from .server import app, mcp, starlette_app
 
@@ -18,12 +21,17 @@ __all__ = [
     "TemplateVariable",
     # Loader
     "load",
+    "load_many",
     "load_from_url",
+    "load_from_urls",
     "load_from_path",
     "load_from_directory",
     "is_url",
+    "classify",
     # Parser
     "parse",
+    "parse_cached",
+    "compile_template",
     "render",
     # Generator
     "register_template",
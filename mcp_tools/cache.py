@@ -0,0 +1,99 @@
+"""Persistent on-disk cache shared across server restarts."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Cache location (default: $XDG_CACHE_HOME/mcp-markdown-template).
+# Setting MCP_CACHE_DIR to an empty string disables the cache.
+_cache_dir_env = os.getenv("MCP_CACHE_DIR")
+CACHE_DIR = (
+    None
+    if _cache_dir_env == ""
+    else Path(
+        _cache_dir_env
+        or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+        / "mcp-markdown-template"
+    )
+)
+
+# Entries neither read nor written for this long are deleted
+MAX_AGE = 30 * 24 * 60 * 60
+
+_pruned: set[str] = set()
+
+
+def _entry_path(namespace: str, key: str) -> Path:
+    """Map a key to a sharded file path inside the cache directory."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / digest[:2] / f"{digest}.json"
+
+
+def _prune(namespace: str) -> None:
+    """Delete stale entries of a namespace, at most once per process."""
+    if namespace in _pruned:
+        return
+    _pruned.add(namespace)
+
+    cutoff = time.time() - MAX_AGE
+    for path in (CACHE_DIR / namespace).glob("*/*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def get(namespace: str, key: str) -> Any | None:
+    """
+    Look up a cached value.
+
+    Returns None on a miss, if the entry cannot be read, or if the cache
+    is disabled.
+    """
+    if CACHE_DIR is None:
+        return None
+
+    path = _entry_path(namespace, key)
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            value = json.load(f)
+        # Mark as recently used so pruning keeps it
+        os.utime(path)
+    except Exception:
+        # Missing or corrupt entries are treated as misses
+        return None
+
+    return value
+
+
+def put(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serializable value in the cache.
+
+    The entry is written atomically; failures are ignored since the cache
+    is only an optimization.
+    """
+    if CACHE_DIR is None:
+        return
+
+    _prune(namespace)
+    path = _entry_path(namespace, key)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
@@ -1,31 +1,100 @@
 """Generate FastAPI endpoints from templates."""
 
+import hashlib
 import re
-from fastapi import FastAPI
-from pydantic import Field, create_model
+from typing import Any
+
+from fastapi import Body, FastAPI
+from fastapi.exceptions import RequestValidationError
 
 from .models import Template
-from .parser import parse, render
+from .parser import compile_template, parse
+
+# Characters stripped when deriving endpoint names
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s]")
+
+# Input schemas keyed by (name, description) pairs, shared by same-shape templates
+_SCHEMA_CACHE: dict[tuple[tuple[str, str], ...], dict[str, Any]] = {}
 
 
 def _slugify(text: str) -> str:
     """Convert text to a valid function/endpoint name."""
     # Remove emojis and special characters, convert to lowercase
-    slug = re.sub(r"[^\w\s]", "", text).strip().lower().replace(" ", "_")
+    slug = SLUG_STRIP_PATTERN.sub("", text).strip().lower().replace(" ", "_")
     return slug or "template"
 
 
-def _create_input_model(tool_name: str, template: Template):
-    """Create a Pydantic model for the tool's input parameters."""
-    fields = {}
+def _create_input_schema(template: Template) -> dict[str, Any]:
+    """
+    Create the JSON schema for the tool's input parameters.
+
+    Templates with the same variables and descriptions share one schema. Its
+    title is derived from that signature so it stays stable across runs.
+    """
+    signature = []
 
     for var in template.variables:
         description = var.description
         if var.example:
             description += f"\n\nExample:\n{var.example}"
-        fields[var.name] = (str, Field(description=description))
+        signature.append((var.name, description))
+
+    key = tuple(signature)
+    schema = _SCHEMA_CACHE.get(key)
+
+    if schema is None:
+        # Built by hand: every field is a required string, so Pydantic's
+        # model and schema machinery would add nothing
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=6).hexdigest()
+        schema = _SCHEMA_CACHE[key] = {
+            "title": f"TemplateInput_{digest}",
+            "type": "object",
+            "properties": {
+                name: {
+                    "type": "string",
+                    "title": name.replace("_", " ").title(),
+                    "description": desc,
+                }
+                for name, desc in key
+            },
+            "required": [name for name, _ in key],
+        }
+
+    return schema
+
+
+def _document_input_schema(app: FastAPI, path: str, schema: dict[str, Any]) -> None:
+    """
+    Publish a route's input schema as a named component referenced by $ref.
+
+    FastAPI only turns Pydantic models into components, so the app's OpenAPI
+    document is patched once, when it is built.
+    """
+    schemas = getattr(app.state, "template_input_schemas", None)
+
+    if schemas is None:
+        schemas = app.state.template_input_schemas = {}
+        build_openapi = app.openapi
+
+        def openapi() -> dict[str, Any]:
+            if app.openapi_schema is None:
+                spec = build_openapi()
+                components = spec.setdefault("components", {})
+                components = components.setdefault("schemas", {})
+
+                for route_path, route_schema in schemas.items():
+                    title = route_schema["title"]
+                    components[title] = route_schema
+                    body = spec["paths"][route_path]["post"]["requestBody"]
+                    body["content"]["application/json"]["schema"] = {
+                        "$ref": f"#/components/schemas/{title}"
+                    }
 
-    return create_model(f"{tool_name.title().replace('_', '')}Input", **fields)
+            return app.openapi_schema
+
+        app.openapi = openapi  # type: ignore[method-assign]
+
+    schemas[path] = schema
 
 
 def register_template(
@@ -52,27 +121,52 @@ def register_template(
     name = tool_name or f"create_{_slugify(template.name)}"
     description = template.about or f"Create content from {template.name} template"
 
-    # Create input model
-    InputModel = _create_input_model(name, template)
-
-    # Capture in closure
-    _template = template
-    _remove_comments = remove_comments
-
-    async def endpoint(input_data: InputModel) -> str:  # type: ignore[valid-type]
-        return render(
-            _template, input_data.model_dump(), remove_comments=_remove_comments
-        )
+    # Create input schema (documentation only, validated by hand below)
+    input_schema = _create_input_schema(template)
+
+    # Compile once at registration; captured in closure
+    _render = compile_template(template, remove_comments)
+    _required = template.variable_names
+
+    async def endpoint(input_data: dict[str, Any] = Body(...)) -> str:
+        # Like the old Pydantic model: check declared fields, ignore the rest
+        errors = []
+        for name in _required:
+            if name not in input_data:
+                errors.append(
+                    {
+                        "type": "missing",
+                        "loc": ("body", name),
+                        "msg": "Field required",
+                        "input": input_data,
+                    }
+                )
+            elif not isinstance(input_data[name], str):
+                errors.append(
+                    {
+                        "type": "string_type",
+                        "loc": ("body", name),
+                        "msg": "Input should be a valid string",
+                        "input": input_data[name],
+                    }
+                )
+        if errors:
+            raise RequestValidationError(errors)
+
+        return _render({name: input_data[name] for name in _required})
 
     # Set metadata
     endpoint.__name__ = name
     endpoint.__doc__ = description
 
-    # Register endpoint
-    app.post(
+    # Register endpoint (directly on the router, skipping the decorator)
+    app.router.add_api_route(
         f"/{name}",
+        endpoint,
+        methods=["POST"],
         name=name,
         description=description,
         summary=template.name or name,
         tags=["Template Tools"],
-    )(endpoint)
+    )
+    _document_input_schema(app, f"/{name}", input_schema)
@@ -1,56 +1,290 @@
 """Load templates from various sources (local files, directories, URLs)."""
 
+import asyncio
+import atexit
+import fnmatch
 import httpx
+import itertools
+import logging
+import mmap
+import os
+import random
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Literal
 from urllib.parse import urlparse
 
+from . import cache
 from .models import Template
 
+logger = logging.getLogger(__name__)
+
+SourceKind = Literal["url", "file", "dir"]
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Retry policy for transient HTTP failures (rate limits, server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
+MAX_RETRY_DELAY = 60.0
+
+# Shared client so repeated fetches from the same host reuse pooled connections
+# (HTTP/2 lets concurrent requests to one host share a single connection)
+_client = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+atexit.register(_client.close)
+
 
 def is_url(source: str) -> bool:
     """Check if source is a URL."""
-    parsed = urlparse(source)
-    return parsed.scheme in ("http", "https")
+    return source.startswith(("http://", "https://"))
+
+
+def _conditional_headers(url: str) -> tuple[dict | None, dict[str, str]]:
+    """Look up a cached response and build revalidation headers for it."""
+    cached = cache.get("http", url)
+    headers = {}
+
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    return cached, headers
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """
+    Seconds to wait before retrying a request, or None to stop retrying.
+
+    Honors Retry-After and GitHub's X-RateLimit-Reset, otherwise backs off
+    exponentially. Waits longer than MAX_RETRY_DELAY are not attempted.
+    """
+    if response.is_success or attempt + 1 >= MAX_ATTEMPTS:
+        return None
+
+    headers = response.headers
+
+    try:
+        if response.status_code in (403, 429) and (
+            headers.get("X-RateLimit-Remaining") == "0"
+        ):
+            delay = float(headers["X-RateLimit-Reset"]) - time.time()
+        elif response.status_code in RETRY_STATUSES:
+            delay = float(headers.get("Retry-After", 2**attempt))
+        else:
+            return None
+    except (KeyError, ValueError):
+        # e.g. Retry-After given as an HTTP date
+        delay = 2**attempt
+
+    if delay > MAX_RETRY_DELAY:
+        return None
+
+    # Jitter so concurrent fetches do not retry in lockstep
+    return max(delay, 0) + random.uniform(0, 0.5)
+
+
+def _read_response(url: str, response: httpx.Response, cached: dict | None) -> str:
+    """Return the body of a response, serving 304s from the cache."""
+    if response.status_code == 304 and cached:
+        return cached["content"]
+
+    response.raise_for_status()
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.put(
+            "http",
+            url,
+            {"etag": etag, "last_modified": last_modified, "content": response.text},
+        )
+
+    return response.text
+
+
+def classify(source: str) -> SourceKind | None:
+    """
+    Classify a source as a URL, local file or local directory.
+
+    Local paths are checked with a single stat. Returns None if the path
+    does not exist or is neither a regular file nor a directory.
+    """
+    if is_url(source):
+        return "url"
+
+    try:
+        mode = os.stat(source).st_mode
+    except (OSError, ValueError):
+        return None
+
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return None
 
 
 def fetch_url(url: str, timeout: int = 30) -> str:
-    """Fetch content from a URL."""
-    with httpx.Client(follow_redirects=True, timeout=timeout) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return response.text
+    """
+    Fetch content from a URL.
+
+    Responses carrying an ETag or Last-Modified header are cached on disk
+    and revalidated with a conditional request on later fetches. Rate-limited
+    and server-error responses are retried with backoff.
+    """
+    cached, headers = _conditional_headers(url)
+
+    for attempt in itertools.count():
+        response = _client.get(url, headers=headers, timeout=timeout)
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return _read_response(url, response, cached)
+        time.sleep(delay)
+
+
+async def _afetch_url(client: httpx.AsyncClient, url: str) -> str:
+    """Fetch content from a URL with an async client."""
+    cached, headers = _conditional_headers(url)
+
+    for attempt in itertools.count():
+        response = await client.get(url, headers=headers)
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return _read_response(url, response, cached)
+        await asyncio.sleep(delay)
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Create the async client used for concurrent fetches."""
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=30,
+        limits=httpx.Limits(max_connections=20),
+    )
+
+
+def _run(coro):
+    """Run a coroutine to completion, even if an event loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # e.g. the app is imported by uvicorn inside its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _template_from_url(url: str, content: str) -> Template:
+    """Build a template from downloaded content."""
+    parsed = urlparse(url)
+    name = Path(parsed.path).stem or "template"
+
+    return Template(name=name, content=content, source=url)
+
+
+def _read_text(path: Path) -> str:
+    """
+    Read a UTF-8 file in one call, bypassing the text-mode wrapper.
+
+    Newlines are normalized to "\n" as `Path.read_text` would.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            text = f.read().decode("utf-8")
+        else:
+            # Decode from the mapping without an intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _try_read_text(path: Path) -> str | Exception:
+    """Read a file like `_read_text`, returning any error instead of raising."""
+    try:
+        return _read_text(path)
+    except Exception as e:
+        return e
 
 
 def load_from_path(path: Path) -> Template:
     """Load a template from a local file."""
     return Template(
         name=path.stem,
-        content=path.read_text(encoding="utf-8"),
+        content=_read_text(path),
         source=str(path),
     )
 
 
 def load_from_url(url: str) -> Template:
     """Load a template from a URL."""
-    parsed = urlparse(url)
-    name = Path(parsed.path).stem or "template"
+    return _template_from_url(url, fetch_url(url))
 
-    return Template(
-        name=name,
-        content=fetch_url(url),
-        source=url,
-    )
+
+def load_from_urls(urls: list[str]) -> list[Template | BaseException]:
+    """
+    Load templates from several URLs concurrently.
+
+    Results are returned in the same order as `urls`. A failed download is
+    returned as its exception instead of being raised, so one bad URL does
+    not discard the others.
+    """
+    results = load_many(urls, kinds=["url"] * len(urls))
+
+    return [
+        result if isinstance(result, BaseException) else result[0] for result in results
+    ]
 
 
 def load_from_directory(directory: Path, pattern: str = "*.md") -> Iterator[Template]:
-    """Load all templates from a directory."""
-    for path in directory.glob(pattern):
-        if path.is_file():
-            yield load_from_path(path)
+    """
+    Load all templates from a directory.
+
+    The pattern is a glob relative to the directory, as for `Path.glob`.
+    Plain file-name patterns such as "*.md" take a faster scandir path.
+    """
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        paths = [path for path in directory.glob(pattern) if path.is_file()]
+    else:
+        # scandir reports entry types without an extra stat per file
+        with os.scandir(directory) as entries:
+            paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern)
+            ]
+
+    # Overlap the reads in a thread pool (file I/O releases the GIL). Workers
+    # only read bytes: templates are loaded while the server module is being
+    # imported, and anything that triggers an import there would deadlock.
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(_try_read_text, paths))
+
+    # Skip unreadable files so one bad file does not discard its siblings
+    for path, content in zip(paths, contents):
+        if isinstance(content, Exception):
+            logger.error("Failed: %s - %s", path, content)
+            continue
+        yield Template(name=path.stem, content=content, source=str(path))
 
 
-def load(source: str, pattern: str = "*.md") -> Iterator[Template]:
+def load(
+    source: str, pattern: str = "*.md", kind: SourceKind | None = None
+) -> Iterator[Template]:
     """
     Load templates from a source.
 
@@ -62,19 +296,70 @@ def load(source: str, pattern: str = "*.md") -> Iterator[Template]:
     Args:
         source: Path or URL to load from
         pattern: Glob pattern for directories (default: "*.md")
+        kind: Result of `classify(source)`, if already known
 
     Yields:
         Template objects
     """
-    if is_url(source):
-        yield load_from_url(source)
-        return
-
-    path = Path(source)
+    kind = kind or classify(source)
 
-    if path.is_file():
-        yield load_from_path(path)
-    elif path.is_dir():
-        yield from load_from_directory(path, pattern)
+    if kind == "url":
+        yield load_from_url(source)
+    elif kind == "file":
+        yield load_from_path(Path(source))
+    elif kind == "dir":
+        yield from load_from_directory(Path(source), pattern)
     else:
         raise ValueError(f"Invalid source: {source}")
+
+
+async def _aload(
+    client: httpx.AsyncClient, source: str, pattern: str, kind: SourceKind | None
+) -> list[Template]:
+    """Load one source, fetching URLs on the event loop and files in a thread."""
+    kind = kind or classify(source)
+
+    if kind == "url":
+        return [_template_from_url(source, await _afetch_url(client, source))]
+
+    return await asyncio.to_thread(lambda: list(load(source, pattern, kind)))
+
+
+async def _aload_many(
+    sources: list[str], pattern: str, kinds: list[SourceKind | None]
+) -> list[list[Template] | BaseException]:
+    """Load several sources concurrently, returning failures in place."""
+    async with _async_client() as client:
+        return await asyncio.gather(
+            *(
+                _aload(client, source, pattern, kind)
+                for source, kind in zip(sources, kinds)
+            ),
+            return_exceptions=True,
+        )
+
+
+def load_many(
+    sources: list[str],
+    pattern: str = "*.md",
+    kinds: list[SourceKind | None] | None = None,
+) -> list[list[Template] | BaseException]:
+    """
+    Load templates from several sources concurrently.
+
+    Network and disk I/O for all sources overlap, so startup waits for the
+    slowest source rather than the sum of all of them.
+
+    Args:
+        sources: Paths or URLs to load from
+        pattern: Glob pattern for directories (default: "*.md")
+        kinds: Results of `classify` for each source, if already known
+
+    Returns:
+        One entry per source, in order: its templates, or the exception
+        raised while loading it
+    """
+    if not sources:
+        return []
+
+    return _run(_aload_many(sources, pattern, kinds or [None] * len(sources)))
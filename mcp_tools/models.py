@@ -1,9 +1,12 @@
 """Data models for template parsing."""
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 
 
-class TemplateVariable(BaseModel):
+# Plain slotted dataclasses: templates are built from trusted, already-typed
+# data, so validation would only slow down loading many of them.
+@dataclass(slots=True)
+class TemplateVariable:
     """A variable extracted from a template."""
 
     name: str
@@ -11,14 +14,15 @@ class TemplateVariable(BaseModel):
     example: str = ""
 
 
-class Template(BaseModel):
+@dataclass(slots=True)
+class Template:
     """A parsed markdown template."""
 
     name: str = ""
     about: str = ""
     content: str = ""
     source: str = ""  # Where the template came from
-    variables: list[TemplateVariable] = Field(default_factory=list)
+    variables: list[TemplateVariable] = field(default_factory=list)
 
     @property
     def variable_names(self) -> list[str]:
@@ -1,15 +1,35 @@
 """Parse markdown templates and extract variables."""
 
+import hashlib
 import re
+from dataclasses import asdict
+from typing import Callable
+
 from jinja2 import Environment, StrictUndefined
 
+from . import cache
 from .models import Template, TemplateVariable
 
+# Bump whenever `parse` output changes so stale cache entries are ignored
+PARSER_VERSION = 2
+
 # Regex patterns
 FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
 VARIABLE_PATTERN = re.compile(r"<([a-z][a-z0-9_]*)>")
 SECTION_PATTERN = re.compile(r"(###\s*[^:\n]+:)")
 COMMENT_PATTERN = re.compile(r"<!--[\s\S]*?-->")
+HEADER_MARKUP_PATTERN = re.compile(r"^###\s*|\s*:$")
+EXAMPLE_PATTERN = re.compile(r"Example:?\s*([\s\S]*)", re.IGNORECASE)
+COMMENT_PLACEHOLDER_PATTERN = re.compile(r"__COMMENT_\d+__\s*\n?")
+
+# Jinja2 environment with custom delimiters for <variable> syntax
+JINJA_ENV = Environment(
+    undefined=StrictUndefined,
+    autoescape=False,
+    keep_trailing_newline=True,
+    variable_start_string="<",
+    variable_end_string=">",
+)
 
 
 def _extract_frontmatter(content: str) -> dict[str, str]:
@@ -36,7 +56,7 @@ def _extract_sections(content: str) -> dict[str, str]:
 
     for i in range(1, len(parts), 2):
         if i + 1 < len(parts):
-            header = re.sub(r"^###\s*|\s*:$", "", parts[i].strip())
+            header = HEADER_MARKUP_PATTERN.sub("", parts[i].strip())
             sections[header] = parts[i + 1]
 
     return sections
@@ -59,7 +79,7 @@ def _extract_variable_info(
         comment_match = re.search(rf"<!--([\s\S]*?)-->\s*<{var_name}>", section_content)
         if comment_match:
             comment = comment_match.group(1).strip()
-            example_match = re.search(r"Example:?\s*([\s\S]*)", comment, re.IGNORECASE)
+            example_match = EXAMPLE_PATTERN.search(comment)
 
             if example_match:
                 var.example = example_match.group(1).strip()
@@ -105,22 +125,52 @@ def parse(template: Template) -> Template:
     )
 
 
-def render(
-    template: Template, values: dict[str, str], remove_comments: bool = True
-) -> str:
+def parse_cached(template: Template) -> Template:
     """
-    Render a template with the given values.
+    Parse a template, reusing the result from the on-disk cache if possible.
+
+    Entries are stored per template source and checked against a fingerprint
+    of the parser version, name and content, so edited files and changed
+    URLs are parsed again and replace their old entry.
+
+    Args:
+        template: Template with raw content
+
+    Returns:
+        Template with parsed variables, name, and about
+    """
+    key = f"{template.source}\0{template.name}"
+    fingerprint = hashlib.sha256(
+        f"{PARSER_VERSION}\0{template.name}\0{template.content}".encode("utf-8")
+    ).hexdigest()
+
+    entry = cache.get("parsed", key)
+    if isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+        try:
+            data = entry["template"]
+            variables = [TemplateVariable(**var) for var in data["variables"]]
+            return Template(**{**data, "variables": variables})
+        except (KeyError, TypeError):
+            pass
+
+    parsed = parse(template)
+    cache.put("parsed", key, {"fingerprint": fingerprint, "template": asdict(parsed)})
+    return parsed
+
+
+def compile_template(
+    template: Template, remove_comments: bool = True
+) -> Callable[[dict[str, str]], str]:
+    """
+    Compile a template once into a reusable render function.
 
     Args:
         template: Parsed template
-        values: Variable values to substitute
         remove_comments: Whether to remove HTML comments
 
     Returns:
-        Rendered markdown string
+        Function mapping variable values to the rendered markdown string
     """
-    content = template.content
-
     # Temporarily replace comments to avoid Jinja2 parsing issues
     comments: list[str] = []
 
@@ -128,23 +178,37 @@ def render(
         comments.append(match.group(0))
         return f"__COMMENT_{len(comments) - 1}__"
 
-    escaped = COMMENT_PATTERN.sub(save_comment, content)
+    escaped = COMMENT_PATTERN.sub(save_comment, template.content)
+    compiled = JINJA_ENV.from_string(escaped)
 
-    # Render with custom delimiters for <variable> syntax
-    env = Environment(
-        undefined=StrictUndefined,
-        autoescape=False,
-        keep_trailing_newline=True,
-        variable_start_string="<",
-        variable_end_string=">",
-    )
-    rendered = env.from_string(escaped).render(**values)
+    def render_values(values: dict[str, str]) -> str:
+        rendered = compiled.render(**values)
+
+        # Handle comments
+        if remove_comments:
+            return COMMENT_PLACEHOLDER_PATTERN.sub("", rendered)
 
-    # Handle comments
-    if remove_comments:
-        rendered = re.sub(r"__COMMENT_\d+__\s*\n?", "", rendered)
-    else:
         for i, comment in enumerate(comments):
             rendered = rendered.replace(f"__COMMENT_{i}__", comment)
+        return rendered
+
+    return render_values
+
+
+def render(
+    template: Template, values: dict[str, str], remove_comments: bool = True
+) -> str:
+    """
+    Render a template with the given values.
 
-    return rendered
+    Use `compile_template` instead when rendering the same template repeatedly.
+
+    Args:
+        template: Parsed template
+        values: Variable values to substitute
+        remove_comments: Whether to remove HTML comments
+
+    Returns:
+        Rendered markdown string
+    """
+    return compile_template(template, remove_comments)(values)
@@ -4,16 +4,19 @@ MCP server for markdown templates.
 Loads templates from configured sources and exposes them as MCP tools.
 """
 
+import logging
 import os
-from pathlib import Path
+import sys
+from typing import Iterable
 
 from fastapi import FastAPI
 from fastmcp import FastMCP
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
-from .loader import load, is_url
-from .parser import parse
+from .loader import classify, load_many
+from .models import Template
+from .parser import parse_cached
 from .generator import register_template
 
 # Configuration from environment
@@ -22,49 +25,71 @@ DESCRIPTION = os.getenv(
     "MCP_DESCRIPTION", "A template for creating MCP-compliant FastAPI"
 )
 TEMPLATES_SOURCE = os.getenv("MCP_TEMPLATES_SOURCE", ".github/ISSUE_TEMPLATE")
+LOG_LEVEL = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+
+# Log through the package logger only, leaving the host's root logger alone
+package_logger = logging.getLogger("mcp_tools")
+package_logger.setLevel(logging.getLevelNamesMapping().get(LOG_LEVEL, logging.INFO))
+if not package_logger.handlers:
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s %(message)s"))
+    package_logger.addHandler(handler)
+
+logger = logging.getLogger(__name__)
+
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    logger.warning("Unknown MCP_LOG_LEVEL %r, using INFO", LOG_LEVEL)
 
 # FastAPI app
 app = FastAPI(title=TITLE, description=DESCRIPTION)
 
 
-def register_from_source(source: str) -> int:
+def register_templates(templates: Iterable[Template]) -> int:
     """
-    Register templates from a source.
+    Register already-loaded templates.
 
     Returns the number of templates registered.
     """
     count = 0
 
-    for template in load(source):
+    for template in templates:
         try:
-            parsed = parse(template)
+            parsed = parse_cached(template)
             register_template(app, parsed)
-            print(f"  ✓ Registered: {parsed.name} from {template.source}")
+            logger.debug("Registered: %s from %s", parsed.name, template.source)
             count += 1
         except Exception as e:
-            print(f"  ✗ Failed: {template.source} - {e}")
+            logger.error("Failed: %s - %s", template.source, e)
 
     return count
 
 
-def _should_use_loader(source: str) -> bool:
-    """Check if source needs the loader (URL or non-existent local path)."""
-    if is_url(source):
-        return True
-    path = Path(source)
-    return path.exists()
-
-
 # Load templates from configured sources (comma-separated)
-print(f"Loading templates from: {TEMPLATES_SOURCE}")
-for source in (s.strip() for s in TEMPLATES_SOURCE.split(",") if s.strip()):
-    try:
-        if _should_use_loader(source):
-            register_from_source(source)
-        else:
-            print(f"  ✗ Source not found: {source}")
-    except Exception as e:
-        print(f"  ✗ Error loading {source}: {e}")
+logger.info("Loading templates from: %s", TEMPLATES_SOURCE)
+sources = [s.strip() for s in TEMPLATES_SOURCE.split(",") if s.strip()]
+
+kinds = {source: classify(source) for source in sources}
+found = [source for source in sources if kinds[source]]
+
+# Load all sources concurrently, then register on this thread in configured order
+loaded = dict(zip(found, load_many(found, kinds=[kinds[s] for s in found])))
+
+for source in sources:
+    if source not in loaded:
+        logger.warning("Source not found: %s", source)
+        continue
+
+    result = loaded[source]
+    if isinstance(result, BaseException):
+        logger.error("Error loading %s: %s", source, result)
+    else:
+        count = register_templates(result)
+        logger.info("Registered %d template(s) from %s", count, source)
+
+# Routes were added in bulk; drop any schema built along the way and build
+# it once from the final route table. from_fastapi reuses the cached schema.
+app.openapi_schema = None
+app.openapi()
 
 # Create MCP server
 mcp = FastMCP.from_fastapi(app=app, stateless_http=True, json_response=True)
@@ -0,0 +1,127 @@
+"""Tests for URL fetching: retries, rate limits and conditional requests."""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+from mcp_tools import cache, loader
+
+URL = "https://raw.githubusercontent.com/owner/repo/main/template.md"
+
+
+class FetchTestCase(unittest.TestCase):
+    """Run fetches against a mock transport with an isolated cache."""
+
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+        self.responses: list[httpx.Response] = []
+        self.sleeps: list[float] = []
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+
+        patches = [
+            mock.patch.object(cache, "CACHE_DIR", Path(cache_dir.name)),
+            mock.patch.object(
+                loader, "_client", httpx.Client(transport=self.transport)
+            ),
+            mock.patch.object(loader.time, "sleep", self.sleeps.append),
+            mock.patch.object(loader.random, "uniform", return_value=0.0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return self.responses.pop(0)
+
+        return httpx.MockTransport(handler)
+
+    def test_retries_after_retry_after(self):
+        self.responses = [
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, text="body"),
+        ]
+
+        self.assertEqual(loader.fetch_url(URL), "body")
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.sleeps, [2.0])
+
+    def test_waits_for_rate_limit_reset(self):
+        reset = int(time.time()) + 5
+        self.responses = [
+            httpx.Response(
+                403,
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(reset),
+                },
+            ),
+            httpx.Response(200, text="body"),
+        ]
+
+        self.assertEqual(loader.fetch_url(URL), "body")
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertTrue(0 < self.sleeps[0] <= 5)
+
+    def test_forbidden_without_rate_limit_is_not_retried(self):
+        self.responses = [httpx.Response(403)]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            loader.fetch_url(URL)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_gives_up_when_delay_exceeds_max(self):
+        delay = loader.MAX_RETRY_DELAY + 1
+        self.responses = [httpx.Response(429, headers={"Retry-After": str(delay)})]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            loader.fetch_url(URL)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_gives_up_after_max_attempts(self):
+        self.responses = [httpx.Response(502) for _ in range(loader.MAX_ATTEMPTS)]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            loader.fetch_url(URL)
+        self.assertEqual(len(self.requests), loader.MAX_ATTEMPTS)
+        self.assertEqual(self.sleeps, [1.0, 2.0, 4.0])
+
+    def test_etag_round_trip_serves_304_from_cache(self):
+        self.responses = [
+            httpx.Response(200, text="body", headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        self.assertEqual(loader.fetch_url(URL), "body")
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+
+        self.assertEqual(loader.fetch_url(URL), "body")
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+
+    def test_async_fetch_retries(self):
+        self.responses = [
+            httpx.Response(503, headers={"Retry-After": "1"}),
+            httpx.Response(200, text="body"),
+        ]
+
+        async def fetch() -> str:
+            async with httpx.AsyncClient(transport=self.transport) as client:
+                return await loader._afetch_url(client, URL)
+
+        with mock.patch.object(loader.asyncio, "sleep", mock.AsyncMock()) as sleep:
+            self.assertEqual(asyncio.run(fetch()), "body")
+        sleep.assert_awaited_once_with(1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()